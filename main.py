@@ -1,54 +1,82 @@
 # main.py
-import time
-from datetime import datetime
+import asyncio
+import threading
 
-from youtube_uploader import YouTubeUploader
-from video_pipeline import generate_main_video, generate_short_from_main
+from aiolimiter import AsyncLimiter
 
-# 288 minutes = 4.8 hours
-INTERVAL_MINUTES = 288
+from youtube_uploader import QuotaExceededError, YouTubeUploader
+from video_pipeline import get_pipeline
 
+# Shared upload budget across concurrent cycles: videos.insert costs 1600
+# quota units, so batch cycles must not burst through the daily quota.
+UPLOAD_LIMITER = AsyncLimiter(5, 3600)
 
-def run_automation_cycle():
-    uploader = YouTubeUploader()
+# Reused across cycles so OAuth state and HTTP connections persist
+_uploader = None
+_uploader_lock = threading.Lock()
 
-    # 1) Main horror video
-    main_data = generate_main_video()
-    main_upload = uploader.upload_video(
-        video_path=main_data["video_path"],
-        title=main_data["title"],
-        description=main_data["description"],
-        tags=main_data.get("tags", []),
-        privacy_status="public",
-    )
-    print("Main video upload result:", main_upload)
 
-    # 2) Short (based on main video)
-    short_data = generate_short_from_main(main_data["video_path"])
-    short_upload = uploader.upload_video(
-        video_path=short_data["video_path"],
-        title=short_data["title"],
-        description=short_data["description"],
-        tags=short_data.get("tags", []),
-        privacy_status="public",
-    )
-    print("Short upload result:", short_upload)
+def get_uploader():
+    """Return the shared YouTubeUploader, creating it on first use."""
+    global _uploader
+    with _uploader_lock:
+        if _uploader is None:
+            _uploader = YouTubeUploader()
+        else:
+            _uploader.refresh_credentials()
+        return _uploader
+
 
+async def upload(uploader, video_data):
+    """
+    Upload a generated video on a worker thread within the shared upload rate limit.
 
-def main_loop():
-    print("Starting 24/7 automation loop on Render...")
+    If the daily YouTube quota is exhausted, waits once for the reset on the
+    event loop (not in the worker thread) and tries again.
+    """
+    waited_for_quota = False
     while True:
-        print(f"[{datetime.utcnow()}] Starting cycle")
+        await UPLOAD_LIMITER.acquire()
         try:
-            run_automation_cycle()
-            print(f"[{datetime.utcnow()}] Cycle finished successfully")
-        except Exception as e:
-            print(f"[{datetime.utcnow()}] Cycle FAILED: {e}")
-        # Wait until next run
-        print(f"Sleeping for {INTERVAL_MINUTES} minutes...")
-        time.sleep(INTERVAL_MINUTES * 60)
+            return await asyncio.to_thread(
+                uploader.upload_video,
+                video_path=video_data["video_path"],
+                title=video_data["title"],
+                description=video_data["description"],
+                tags=video_data.get("tags", []),
+                privacy_status="public",
+            )
+        except QuotaExceededError as e:
+            if waited_for_quota:
+                raise
+            waited_for_quota = True
+            print(f"YouTube quota exceeded - waiting {e.retry_after / 3600:.1f} hours for the daily reset")
+            await asyncio.sleep(e.retry_after)
 
 
-if __name__ == "__main__":
-    main_loop()
+async def run_automation_cycle():
+    uploader = await asyncio.to_thread(get_uploader)
+    # Built off the loop: the first call probes FFmpeg encoders
+    pipeline = await asyncio.to_thread(get_pipeline)
+
+    # 1) Main horror video
+    main_data = await pipeline.create_complete_video("main")
 
+    # 2) Upload main video while the short is generated; if either fails,
+    #    the other is cancelled rather than left running unattended
+    async with asyncio.TaskGroup() as tg:
+        main_task = tg.create_task(upload(uploader, main_data))
+        short_task = tg.create_task(pipeline.create_complete_video("short", 1))
+    main_upload, short_data = main_task.result(), short_task.result()
+    print("Main video upload result:", main_upload)
+
+    # 3) Short upload
+    short_upload = await upload(uploader, short_data)
+    print("Short upload result:", short_upload)
+
+    return main_upload
+
+
+if __name__ == "__main__":
+    # Run a single cycle; scheduler.py drives the recurring schedule
+    print("Cycle result:", asyncio.run(run_automation_cycle()))
@@ -1,8 +1,7 @@
 import os
+import asyncio
 import time
-from apscheduler.schedulers.blocking import BlockingScheduler
-from apscheduler.triggers.interval import IntervalTrigger
-from datetime import datetime
+from datetime import datetime, timedelta, timezone
 import logging
 
 # Import main automation function (will be defined in main.py)
@@ -15,38 +14,90 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+JOB_ID = 'youtube_automation_job'
+
+# Scheduler whose job_wrapper the persisted job runs (set by AutomationScheduler.run)
+_active_scheduler = None
+
+
+async def run_scheduled_job():
+    """
+    Entry point of the persisted job.
+    
+    Persistent job stores can only reference module-level functions, so
+    this forwards to the running AutomationScheduler.
+    """
+    await _active_scheduler.job_wrapper()
+
 
 class AutomationScheduler:
     """Schedules and runs the YouTube automation every 288 minutes."""
     
-    def __init__(self, interval_minutes=288):
+    def __init__(self, interval_minutes=288, batch_size=1, jobstore_url='sqlite:///jobs.sqlite'):
         """
         Initialize the scheduler.
         
         Args:
             interval_minutes: How often to run automation (default: 288 = 4.8 hours)
+            batch_size: Number of automation cycles to run concurrently per run (default: 1)
+            jobstore_url: SQLAlchemy URL where the schedule is persisted across restarts
         """
+        # APScheduler (and SQLAlchemy behind the job store) are imported on first use
+        from apscheduler.executors.asyncio import AsyncIOExecutor
+        from apscheduler.jobstores.sqlalchemy import SQLAlchemyJobStore
+        from apscheduler.schedulers.asyncio import AsyncIOScheduler
+        
         self.interval_minutes = interval_minutes
-        self.scheduler = BlockingScheduler(timezone='UTC')
+        self.batch_size = batch_size
+        self.scheduler = AsyncIOScheduler(
+            timezone='UTC',
+            jobstores={
+                'default': SQLAlchemyJobStore(url=jobstore_url)
+            },
+            executors={
+                'default': AsyncIOExecutor()  # Runs the async automation cycle
+            }
+        )
         
         # Track job statistics
         self.total_runs = 0
         self.successful_runs = 0
         self.failed_runs = 0
     
-    def job_wrapper(self):
-        """Wrapper function that executes the automation cycle with error handling."""
-        self.total_runs += 1
+    async def run_batch(self, n):
+        """
+        Run n automation cycles concurrently.
+        
+        The shared OpenAI and YouTube rate limiters keep concurrent cycles
+        within provider limits.
+        
+        Args:
+            n: Number of cycles to run
+        
+        Returns:
+            list: Each cycle's result, or the exception it raised
+        """
+        return await asyncio.gather(
+            *[run_automation_cycle() for _ in range(n)],
+            return_exceptions=True
+        )
+    
+    async def job_wrapper(self):
+        """Wrapper function that executes the automation cycle(s) with error handling."""
         job_start = datetime.now()
         
-        logger.info(f"=== Starting automation cycle #{self.total_runs} ===")
+        logger.info(f"=== Starting automation cycle #{self.total_runs + 1} (batch of {self.batch_size}) ===")
         logger.info(f"Scheduled interval: Every {self.interval_minutes} minutes")
         
-        try:
-            # Run the main automation cycle
-            result = run_automation_cycle()
-            
-            if result and result.get('status') == 'success':
+        # Run the main automation cycle(s)
+        results = await self.run_batch(self.batch_size)
+        
+        for result in results:
+            self.total_runs += 1
+            if isinstance(result, BaseException):
+                self.failed_runs += 1
+                logger.error(f"✗ Automation cycle failed with exception: {result}", exc_info=result)
+            elif result and result.get('status') == 'success':
                 self.successful_runs += 1
                 logger.info(f"✓ Automation cycle completed successfully")
                 logger.info(f"  - Video uploaded: {result.get('video_url', 'N/A')}")
@@ -55,10 +106,6 @@ class AutomationScheduler:
                 self.failed_runs += 1
                 logger.error(f"✗ Automation cycle completed with errors")
         
-        except Exception as e:
-            self.failed_runs += 1
-            logger.error(f"✗ Automation cycle failed with exception: {e}", exc_info=True)
-        
         # Calculate runtime
         job_duration = (datetime.now() - job_start).total_seconds()
         logger.info(f"Job duration: {job_duration:.2f} seconds")
@@ -66,41 +113,73 @@ class AutomationScheduler:
         logger.info(f"Next run in {self.interval_minutes} minutes")
         logger.info("=" * 60)
     
-    def start(self, run_immediately=True):
+    async def run(self, run_immediately=True):
         """
-        Start the scheduler.
+        Run the scheduler on the current event loop until cancelled.
         
         Args:
-            run_immediately: If True, runs first cycle immediately before starting schedule
+            run_immediately: If True and no schedule is persisted yet, runs first
+                cycle immediately before starting schedule
         """
+        from apscheduler.triggers.interval import IntervalTrigger
+        
         logger.info("=" * 60)
         logger.info("YouTube Horror Automation Scheduler Starting")
         logger.info(f"Interval: Every {self.interval_minutes} minutes ({self.interval_minutes/60:.2f} hours)")
         logger.info("=" * 60)
         
-        # Run first cycle immediately if requested
-        if run_immediately:
-            logger.info("Running first automation cycle immediately...")
-            self.job_wrapper()
-        
-        # Schedule recurring job
-        self.scheduler.add_job(
-            func=self.job_wrapper,
-            trigger=IntervalTrigger(minutes=self.interval_minutes),
-            id='youtube_automation_job',
-            name='YouTube Horror Video Automation',
-            replace_existing=True,
-            max_instances=1  # Prevent overlapping runs
-        )
+        global _active_scheduler
+        _active_scheduler = self
+        
+        # Start paused so a persisted schedule can be inspected before jobs fire
+        self.scheduler.start(paused=True)
+        job = self.scheduler.get_job(JOB_ID)
+        
+        if job is None:
+            # Persist the schedule first, with the first run one interval out,
+            # so a restart during the immediate cycle does not run it again
+            self.scheduler.add_job(
+                func=run_scheduled_job,
+                trigger=IntervalTrigger(minutes=self.interval_minutes),
+                id=JOB_ID,
+                name='YouTube Horror Video Automation',
+                replace_existing=True,
+                max_instances=1,  # Prevent overlapping runs
+                coalesce=True,  # Collapse missed runs into one
+                misfire_grace_time=3600,  # Still run if overdue by less than an hour
+                next_run_time=datetime.now(timezone.utc) + timedelta(minutes=self.interval_minutes)
+            )
+            
+            # First boot: run first cycle immediately if requested
+            if run_immediately:
+                logger.info("Running first automation cycle immediately...")
+                await self.job_wrapper()
+        else:
+            logger.info("Resuming persisted schedule")
+            if job.trigger.interval != timedelta(minutes=self.interval_minutes):
+                logger.info(f"Interval changed, rescheduling to every {self.interval_minutes} minutes")
+                self.scheduler.reschedule_job(JOB_ID, trigger=IntervalTrigger(minutes=self.interval_minutes))
+        
+        self.scheduler.resume()
+        logger.info(f"Scheduler configured. Next run: {self.scheduler.get_job(JOB_ID).next_run_time}")
         
-        logger.info(f"Scheduler configured. Next run: {self.scheduler.get_jobs()[0].next_run_time}")
+        try:
+            # Keep the event loop serving scheduled jobs forever
+            await asyncio.Event().wait()
+        finally:
+            self.scheduler.shutdown(wait=False)
+    
+    def start(self, run_immediately=True):
+        """
+        Start the scheduler (blocks forever).
         
+        Args:
+            run_immediately: If True, runs first cycle immediately before starting schedule
+        """
         try:
-            # Start the scheduler (blocks forever)
-            self.scheduler.start()
+            asyncio.run(self.run(run_immediately=run_immediately))
         except (KeyboardInterrupt, SystemExit):
             logger.info("Scheduler shutdown requested")
-            self.scheduler.shutdown()
             logger.info("Scheduler stopped gracefully")
 
 
@@ -112,11 +191,21 @@ if __name__ == '__main__':
     # Option to run immediately or wait for first interval
     run_immediately = os.getenv('RUN_IMMEDIATELY', 'true').lower() == 'true'
     
+    # Number of cycles to run concurrently on each scheduled run
+    batch_size = int(os.getenv('AUTOMATION_BATCH_SIZE', '1'))
+    
+    # Where the schedule is persisted so restarts keep the cycle clock
+    jobstore_url = os.getenv('AUTOMATION_JOBSTORE_URL', 'sqlite:///jobs.sqlite')
+    
     # Create and start scheduler
-    scheduler = AutomationScheduler(interval_minutes=interval)
+    scheduler = AutomationScheduler(
+        interval_minutes=interval,
+        batch_size=batch_size,
+        jobstore_url=jobstore_url
+    )
     
     logger.info(f"Environment: {os.getenv('RAILWAY_ENVIRONMENT', 'local')}")
     logger.info(f"Run immediately: {run_immediately}")
+    logger.info(f"Batch size: {batch_size}")
     
     scheduler.start(run_immediately=run_immediately)
-v
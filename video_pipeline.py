@@ -1,18 +1,124 @@
 import os
+import re
 import json
+import math
+import shutil
+import asyncio
+import hashlib
 import subprocess
 import random
+import time
+import uuid
+import threading
+from collections import deque
 from pathlib import Path
-from openai import OpenAI
 from datetime import datetime
 
+from aiolimiter import AsyncLimiter
+from tenacity import retry, retry_if_exception, stop_after_attempt, wait_exponential_jitter
+
+# Shared OpenAI request budget (requests per minute) across concurrent cycles
+OPENAI_LIMITER = AsyncLimiter(200, 60)
+
+# Narration voice (gpt-4o-mini-tts takes pacing/tone instructions instead of speed)
+TTS_MODEL = 'gpt-4o-mini-tts'
+TTS_VOICE = 'onyx'  # Deep, dramatic voice perfect for horror
+TTS_INSTRUCTIONS = 'Narrate slowly and deliberately in a low, ominous, suspenseful tone.'
+
+# Thumbnail cache settings
+THUMBNAIL_CACHE_MAX_ENTRIES = 200
+THUMBNAIL_SIMILARITY_THRESHOLD = 0.92
+THUMBNAIL_EMBEDDING_MODEL = 'text-embedding-3-small'
+THUMBNAIL_EMBEDDING_DIMENSIONS = 256
+
+# Rendered audio/video cache settings
+CONTENT_CACHE_MAX_BYTES = 5 * 1024 ** 3  # Total size of cached audio + video
+
+# Retries for transient failures when downloading generated images
+DOWNLOAD_RETRIES = 3
+
+# Number of FFmpeg stderr lines kept for error reporting
+FFMPEG_ERROR_TAIL_LINES = 20
+
+# H.264 encoders in order of preference; hardware encoders are only used
+# if FFmpeg lists them and a short trial encode succeeds.
+VAAPI_DEVICE = '/dev/dri/renderD128'
+HARDWARE_VIDEO_ENCODERS = [
+    {
+        'name': 'h264_nvenc',
+        'input_args': [],
+        'filter': '',
+        'codec_args': ['-c:v', 'h264_nvenc', '-preset', 'p4', '-tune', 'll', '-rc', 'vbr', '-cq', '28'],
+    },
+    {
+        'name': 'h264_videotoolbox',
+        'input_args': [],
+        'filter': '',
+        'codec_args': ['-c:v', 'h264_videotoolbox', '-b:v', '4M'],
+    },
+    {
+        'name': 'h264_vaapi',
+        'input_args': ['-vaapi_device', VAAPI_DEVICE],
+        'filter': ',format=nv12,hwupload',
+        'codec_args': ['-c:v', 'h264_vaapi', '-qp', '28'],
+    },
+]
+SOFTWARE_VIDEO_ENCODER = {
+    'name': 'libx264',
+    'input_args': [],
+    'filter': '',
+    'codec_args': [
+        '-c:v', 'libx264', '-preset', 'veryfast', '-tune', 'stillimage', '-crf', '28',
+        '-threads', '0', '-x264-params', 'sliced-threads=1'
+    ],
+}
+
+
+def _is_rate_limited(exc):
+    """True if an API error is an HTTP 429 (rate limit) response."""
+    return getattr(exc, 'status_code', None) == 429
+
+
+# Back off and retry OpenAI calls that hit the rate limit (HTTP 429)
+_retry_rate_limited = retry(
+    retry=retry_if_exception(_is_rate_limited),
+    wait=wait_exponential_jitter(initial=2, max=60),
+    stop=stop_after_attempt(5),
+    reraise=True
+)
+
+
+def _partial_path(path):
+    """Return a unique temporary name next to path, keeping its extension."""
+    path = Path(path)
+    return path.with_name(f'{path.stem}.{uuid.uuid4().hex[:8]}.part{path.suffix}')
+
+
+def _copy_atomic(src, dst):
+    """Copy src to dst via a unique temporary file so dst is never left half-written."""
+    partial_path = _partial_path(dst)
+    try:
+        shutil.copyfile(src, partial_path)
+        os.replace(partial_path, dst)
+    finally:
+        partial_path.unlink(missing_ok=True)
+
+
+def _cosine_similarity(a, b):
+    """Cosine similarity between two equal-length vectors."""
+    dot = sum(x * y for x, y in zip(a, b))
+    norm = math.sqrt(sum(x * x for x in a)) * math.sqrt(sum(y * y for y in b))
+    return dot / norm if norm else 0.0
+
 
 class VideoPipeline:
     """Advanced horror video generation pipeline using OpenAI + FFmpeg."""
     
     def __init__(self, output_dir='outputs'):
         """Initialize the video pipeline."""
-        self.client = OpenAI(api_key=os.getenv('OPENAI_API_KEY'))
+        self._client = None
+        self._client_loop = None
+        self._http = None
         self.output_dir = Path(output_dir)
         self.output_dir.mkdir(exist_ok=True)
         
@@ -20,157 +126,509 @@ class VideoPipeline:
         (self.output_dir / 'audio').mkdir(exist_ok=True)
         (self.output_dir / 'videos').mkdir(exist_ok=True)
         (self.output_dir / 'thumbnails').mkdir(exist_ok=True)
+        (self.output_dir / 'assets').mkdir(exist_ok=True)
+        self.thumbnail_cache_dir = self.output_dir / 'thumbnails' / 'cache'
+        self.thumbnail_cache_dir.mkdir(exist_ok=True)
+        self.content_cache_dir = self.output_dir / 'cache'
+        self.content_cache_dir.mkdir(exist_ok=True)
+        
+        # Absolute ffmpeg path: lets subprocess take the posix_spawn fast path
+        self._ffmpeg_bin = shutil.which('ffmpeg') or 'ffmpeg'
+        
+        # Pick the fastest available H.264 encoder once
+        self.video_encoder = self._detect_video_encoder()
+    
+    async def _complete_json(self, prompt):
+        """Run a JSON-mode chat completion with the horror writer persona."""
+        response = await self._call_openai(
+            self.client.chat.completions.create,
+            model="gpt-4o-mini",
+            messages=[
+                {"role": "system", "content": "You are a professional horror content writer for YouTube. Create engaging, scary stories that keep viewers hooked."},
+                {"role": "user", "content": prompt}
+            ],
+            response_format={"type": "json_object"},
+            temperature=0.9
+        )
+        return json.loads(response.choices[0].message.content)
     
-    def generate_horror_script(self, video_type='main', duration_minutes=3):
+    async def generate_title_and_outline(self, video_type='main', duration_minutes=3):
         """
-        Generate a horror script using OpenAI.
+        Generate the title, metadata and a short outline of a horror story.
+        
+        This is a cheap call, so the thumbnail can start while the full
+        narration is still being written.
         
         Args:
             video_type: 'main' (2-5 min) or 'short' (1 min)
             duration_minutes: Target duration in minutes
         
         Returns:
-            dict: Script data with title, narration, description, tags
+            dict: Outline data with title, summary, description, tags
         """
         if video_type == 'short':
-            prompt = """Generate a short 60-second horror story perfect for YouTube Shorts.
+            prompt = """Plan a short 60-second horror story perfect for YouTube Shorts.
 
 Requirements:
 - Hook in first 3 seconds
 - One terrifying scene or twist
 - Cliffhanger ending
-- Narration: 150-180 words
 - Title must be attention-grabbing with numbers or questions
 - Include 5 relevant hashtags
+- Summary: 2-3 sentences covering the hook, the scare and the cliffhanger
 
 Format your response as JSON:
 {
   "title": "string",
-  "narration": "string",
+  "summary": "string",
   "description": "string",
   "tags": ["tag1", "tag2", "tag3", "tag4", "tag5"]
 }"""
         else:
-            word_count = duration_minutes * 150  # ~150 words per minute
-            prompt = f"""Generate a {duration_minutes}-minute horror story for YouTube.
+            prompt = f"""Plan a {duration_minutes}-minute horror story for YouTube.
 
 Requirements:
 - Compelling hook in first 15 seconds
 - Build tension gradually
 - Satisfying climax and resolution
-- Narration: {word_count}-{word_count + 50} words
 - Title with keywords for SEO (include "TRUE", "REAL", year, or location)
 - Include 10 relevant tags
+- Summary: 3-5 sentences covering the hook, the build-up, the climax and the resolution
 
 Popular themes: urban legends, true crime, paranormal, creepypasta, scary stories
 
 Format your response as JSON:
 {{
   "title": "string",
-  "narration": "string",
+  "summary": "string",
   "description": "string",
   "tags": ["tag1", "tag2", ..., "tag10"]
 }}"""
         
-        print(f"Generating {video_type} horror script...")
-        response = self.client.chat.completions.create(
-            model="gpt-4o-mini",
-            messages=[
-                {"role": "system", "content": "You are a professional horror content writer for YouTube. Create engaging, scary stories that keep viewers hooked."},
-                {"role": "user", "content": prompt}
-            ],
-            response_format={"type": "json_object"},
-            temperature=0.9
-        )
-        
-        script_data = json.loads(response.choices[0].message.content)
-        print(f"✓ Script generated: {script_data['title']}")
-        return script_data
+        print(f"Generating {video_type} horror outline...")
+        outline = await self._complete_json(prompt)
+        print(f"✓ Outline generated: {outline['title']}")
+        return outline
     
-    def generate_audio(self, text, filename):
+    async def expand_narration(self, outline, video_type='main', duration_minutes=3):
         """
-        Generate audio narration using OpenAI TTS.
+        Write the full narration for an outline.
         
         Args:
-            text: Script text to convert to speech
-            filename: Output filename (without extension)
+            outline: Outline data from generate_title_and_outline
+            video_type: 'main' (2-5 min) or 'short' (1 min)
+            duration_minutes: Target duration in minutes
         
         Returns:
-            Path: Path to generated audio file
+            str: Narration text
         """
-        audio_path = self.output_dir / 'audio' / f'{filename}.mp3'
+        if video_type == 'short':
+            requirements = """- Hook in first 3 seconds
+- One terrifying scene or twist
+- Cliffhanger ending
+- Narration: 150-180 words"""
+        else:
+            word_count = duration_minutes * 150  # ~150 words per minute
+            requirements = f"""- Compelling hook in first 15 seconds
+- Build tension gradually
+- Satisfying climax and resolution
+- Narration: {word_count}-{word_count + 50} words"""
         
-        print(f"Generating audio narration...")
-        response = self.client.audio.speech.create(
-            model="tts-1",
-            voice="onyx",  # Deep, dramatic voice perfect for horror
-            input=text,
-            speed=0.95  # Slightly slower for dramatic effect
-        )
+        prompt = f"""Write the narration for this horror story.
+
+Title: {outline['title']}
+Outline: {outline['summary']}
+
+Requirements:
+{requirements}
+
+Format your response as JSON:
+{{
+  "narration": "string"
+}}"""
         
-        response.stream_to_file(str(audio_path))
-        print(f"✓ Audio saved: {audio_path}")
-        return audio_path
+        print(f"Writing {video_type} narration...")
+        narration = (await self._complete_json(prompt))['narration']
+        print(f"✓ Narration written: {len(narration.split())} words")
+        return narration
     
-    def create_video_with_ffmpeg(self, audio_path, video_type='main', filename='output'):
+    async def generate_horror_script(self, video_type='main', duration_minutes=3):
         """
-        Create video using FFmpeg with audio + visual effects.
+        Generate a horror script using OpenAI.
         
         Args:
-            audio_path: Path to audio file
-            video_type: 'main' or 'short' (affects resolution)
-            filename: Output filename
+            video_type: 'main' (2-5 min) or 'short' (1 min)
+            duration_minutes: Target duration in minutes
         
         Returns:
-            Path: Path to generated video file
+            dict: Script data with title, narration, description, tags
         """
-        video_path = self.output_dir / 'videos' / f'{filename}.mp4'
+        outline = await self.generate_title_and_outline(video_type, duration_minutes)
+        narration = await self.expand_narration(outline, video_type, duration_minutes)
+        return {**outline, 'narration': narration}
+    
+    @property
+    def client(self):
+        """
+        OpenAI client shared by all calls made on the running event loop.
         
-        # Get audio duration
-        duration_cmd = [
-            'ffprobe', '-v', 'error', '-show_entries', 'format=duration',
-            '-of', 'default=noprint_wrappers=1:nokey=1', str(audio_path)
+        The async HTTP connection pool is bound to the loop it was created
+        on, so a new client is only built when the pipeline is driven from
+        a different loop (e.g. a later create_complete_video_sync call).
+        """
+        loop = asyncio.get_running_loop()
+        if self._client is None or self._client_loop is not loop:
+            # Imported on first use to keep start-up light
+            from openai import AsyncOpenAI
+            
+            self._client = AsyncOpenAI(api_key=os.getenv('OPENAI_API_KEY'))
+            self._client_loop = loop
+        return self._client
+    
+    @_retry_rate_limited
+    async def _call_openai(self, create, **kwargs):
+        """Call an OpenAI endpoint within the shared rate limit, backing off on 429."""
+        async with OPENAI_LIMITER:
+            return await create(**kwargs)
+    
+    def _detect_video_encoder(self):
+        """
+        Detect the fastest H.264 encoder usable on this machine.
+        
+        Returns:
+            dict: Encoder profile (name, input args, filter suffix, codec args)
+        """
+        try:
+            listing = subprocess.run(
+                [self._ffmpeg_bin, '-hide_banner', '-encoders'],
+                check=True, capture_output=True, text=True,
+                stdin=subprocess.DEVNULL, close_fds=False
+            ).stdout
+        except (OSError, subprocess.CalledProcessError):
+            listing = ''
+        
+        for encoder in HARDWARE_VIDEO_ENCODERS:
+            if encoder['name'] in listing and self._encoder_works(encoder):
+                print(f"✓ Using hardware video encoder: {encoder['name']}")
+                return encoder
+        
+        return SOFTWARE_VIDEO_ENCODER
+    
+    def _encoder_works(self, encoder):
+        """Check that an encoder can actually open its device with a tiny trial encode."""
+        trial_cmd = [
+            self._ffmpeg_bin, '-hide_banner', '-nostats', '-loglevel', 'error',
+            *encoder['input_args'],
+            '-f', 'lavfi', '-i', 'color=c=black:s=256x256:d=0.1',
+            '-vf', f"null{encoder['filter']}",
+            *encoder['codec_args'],
+            '-f', 'null', '-'
         ]
-        duration = float(subprocess.check_output(duration_cmd).decode().strip())
+        try:
+            subprocess.run(
+                trial_cmd, check=True, capture_output=True, timeout=30,
+                stdin=subprocess.DEVNULL, close_fds=False
+            )
+        except (OSError, subprocess.SubprocessError):
+            return False
+        return True
+    
+    def _audio_duration(self, audio_path):
+        """Read the audio duration in seconds from the MP3 header."""
+        from mutagen.mp3 import MP3
         
-        # Set resolution based on video type
+        return MP3(str(audio_path)).info.length
+    
+    def _resolution(self, video_type):
+        """Return the (width, height) for a video type."""
         if video_type == 'short':
-            width, height = 1080, 1920  # Vertical for Shorts
-        else:
-            width, height = 1920, 1080  # Horizontal for main videos
-        
-        print(f"Creating {video_type} video with FFmpeg...")
-        
-        # Create atmospheric horror video with animated gradient background
-        # and pulsing text overlay effect
-        ffmpeg_cmd = [
-            'ffmpeg', '-y',
-            # Generate animated dark gradient background
-            '-f', 'lavfi', '-i', f'color=c=0x0a0a0a:s={width}x{height}:d={duration}',
-            # Add noise overlay for grain effect
-            '-f', 'lavfi', '-i', f'noise=c0s=10:allf=t:s={width}x{height}:d={duration}',
-            # Audio input
-            '-i', str(audio_path),
-            # Complex filter for visual effects
-            '-filter_complex',
-            f'[0:v][1:v]blend=all_mode=overlay:all_opacity=0.3[bg];'
-            f'[bg]fade=t=in:st=0:d=1,fade=t=out:st={duration-1}:d=1[v]',
+            return 1080, 1920  # Vertical for Shorts
+        return 1920, 1080  # Horizontal for main videos
+    
+    def _background_still(self, width, height):
+        """
+        Return a dark film-grain background image, rendering it once per resolution.
+        
+        The video is encoded from this single still, so no per-frame
+        background or noise has to be generated.
+        """
+        background_path = self.output_dir / 'assets' / f'bg_{width}x{height}.png'
+        if background_path.exists():
+            return background_path
+        
+        print(f"Rendering {width}x{height} background...")
+        # Concurrent cycles may render the same still; each writes its own file
+        partial_path = _partial_path(background_path)
+        try:
+            self._run_ffmpeg([
+                self._ffmpeg_bin, '-y', '-nostats', '-loglevel', 'error',
+                '-f', 'lavfi', '-i', f'color=c=0x0a0a0a:s={width}x{height},noise=c0s=10:allf=t',
+                '-frames:v', '1',
+                str(partial_path)
+            ])
+            os.replace(partial_path, background_path)
+        finally:
+            partial_path.unlink(missing_ok=True)
+        return background_path
+    
+    def _build_ffmpeg_cmd(self, video_path, background_path, audio_copy_path):
+        """
+        Build the FFmpeg command that renders the horror visuals over MP3 audio read from stdin.
+        
+        The audio length is unknown while it streams in, so the video ends
+        with the audio and the fade-out is added afterwards (see _fade_out_video).
+        
+        Args:
+            video_path: Output video path
+            background_path: Still background image
+            audio_copy_path: Where to also save the input audio unchanged
+        """
+        encoder = self.video_encoder
+        
+        # Encode the pre-rendered film-grain still under the narration
+        return [
+            self._ffmpeg_bin, '-y', '-nostats', '-loglevel', 'error',
+            *encoder['input_args'],
+            # Dark grain background image
+            '-loop', '1', '-framerate', '1', '-i', str(background_path),
+            # Streamed TTS audio
+            '-f', 'mp3', '-i', 'pipe:0',
+            # The still is read at 1 fps and only upsampled to 30 fps for the fade-in
+            '-vf', f'fps=30,format=yuv420p,fade=t=in:st=0:d=1{encoder["filter"]}',
+            '-map', '0:v', '-map', '1:a', '-shortest',
             # Video codec settings
-            '-map', '[v]', '-map', '2:a',
-            '-c:v', 'libx264', '-preset', 'medium', '-crf', '23',
-            '-c:a', 'aac', '-b:a', '192k',
+            *encoder['codec_args'],
+            # MP4 carries the TTS MP3 as-is (YouTube re-encodes anyway)
+            '-c:a', 'copy',
             '-movflags', '+faststart',
-            str(video_path)
+            str(video_path),
+            # Second output: the received MP3, unchanged
+            '-map', '1:a', '-c:a', 'copy', str(audio_copy_path)
         ]
+    
+    def _fade_out_video(self, video_path, duration):
+        """
+        Add the one-second fade-out to a rendered video in a second pass.
+        
+        Only the video stream is re-encoded; encoding the static background
+        is fast, and the audio is copied.
+        
+        Args:
+            video_path: Rendered video, replaced in place
+            duration: Audio duration in seconds
+        """
+        encoder = self.video_encoder
+        partial_path = _partial_path(video_path)
+        try:
+            self._run_ffmpeg([
+                self._ffmpeg_bin, '-y', '-nostats', '-loglevel', 'error',
+                *encoder['input_args'],
+                '-i', str(video_path),
+                '-vf', f'fade=t=out:st={max(duration - 1, 0)}:d=1{encoder["filter"]}',
+                *encoder['codec_args'],
+                '-c:a', 'copy',
+                '-movflags', '+faststart',
+                str(partial_path)
+            ])
+            os.replace(partial_path, video_path)
+        finally:
+            partial_path.unlink(missing_ok=True)
+    
+    def _run_ffmpeg(self, cmd):
+        """Run FFmpeg, streaming its stderr and keeping only the last lines for errors."""
+        tail = deque(maxlen=FFMPEG_ERROR_TAIL_LINES)
+        proc = subprocess.Popen(
+            cmd,
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
+            bufsize=1,
+            text=True,
+            errors='replace',
+            # Python fds are non-inheritable (PEP 446), so skip the fd-closing
+            # walk; with an absolute binary this allows posix_spawn
+            close_fds=False
+        )
+        with proc:
+            for line in proc.stderr:
+                tail.append(line)
+        if proc.returncode != 0:
+            raise subprocess.CalledProcessError(proc.returncode, cmd, stderr=''.join(tail))
+    
+    async def _collect_stderr(self, stream):
+        """Drain an asyncio subprocess stderr stream, returning only its last lines."""
+        tail = deque(maxlen=FFMPEG_ERROR_TAIL_LINES)
+        async for line in stream:
+            tail.append(line.decode(errors='replace'))
+        return ''.join(tail)
+    
+    @_retry_rate_limited
+    async def _stream_narration_video(self, text, video_type, filename):
+        """
+        Synthesize narration and encode the video while it streams in.
         
-        subprocess.run(ffmpeg_cmd, check=True, capture_output=True)
+        TTS audio is streamed straight into FFmpeg's stdin, so encoding runs
+        while the narration is still being generated. FFmpeg also saves the
+        received MP3 unchanged as the audio file, whose duration then drives
+        a short second pass that adds the fade-out. A rate-limited TTS
+        request kills FFmpeg and the whole render is retried from scratch.
+        
+        Args:
+            text: Script text to convert to speech
+            video_type: 'main' or 'short' (affects resolution)
+            filename: Output filename (without extension)
+        
+        Returns:
+            tuple: (audio_path, video_path)
+        """
+        audio_path = self.output_dir / 'audio' / f'{filename}.mp3'
+        video_path = self.output_dir / 'videos' / f'{filename}.mp4'
+        background_path = await asyncio.to_thread(self._background_still, *self._resolution(video_type))
+        
+        print(f"Generating narration and {video_type} video...")
+        ffmpeg_cmd = self._build_ffmpeg_cmd(video_path, background_path, audio_path)
+        proc = await asyncio.create_subprocess_exec(
+            *ffmpeg_cmd,
+            stdin=asyncio.subprocess.PIPE,
+            stdout=asyncio.subprocess.DEVNULL,
+            stderr=asyncio.subprocess.PIPE,
+            close_fds=False
+        )
+        stderr_task = asyncio.create_task(self._collect_stderr(proc.stderr))
+        
+        try:
+            async with OPENAI_LIMITER:
+                async with self.client.audio.speech.with_streaming_response.create(
+                    model=TTS_MODEL,
+                    voice=TTS_VOICE,
+                    input=text,
+                    instructions=TTS_INSTRUCTIONS,
+                    response_format='mp3'
+                ) as response:
+                    async for chunk in response.iter_bytes():
+                        proc.stdin.write(chunk)
+                        await proc.stdin.drain()
+        except (BrokenPipeError, ConnectionResetError):
+            pass  # FFmpeg exited early; its error is reported below
+        except BaseException:
+            proc.kill()
+            await proc.wait()
+            stderr_task.cancel()
+            raise
+        proc.stdin.close()
+        
+        stderr = await stderr_task
+        returncode = await proc.wait()
+        if returncode != 0:
+            raise subprocess.CalledProcessError(returncode, ffmpeg_cmd, stderr=stderr)
+        
+        # The narration length is only known now that it has been saved
+        duration = await asyncio.to_thread(self._audio_duration, audio_path)
+        await asyncio.to_thread(self._fade_out_video, video_path, duration)
+        
+        print(f"✓ Audio saved: {audio_path}")
         print(f"✓ Video created: {video_path}")
-        return video_path
+        return audio_path, video_path
+    
+    def _normalize_theme(self, title):
+        """Lowercase a title and collapse punctuation and whitespace."""
+        return ' '.join(re.sub(r'[^a-z0-9]+', ' ', title.lower()).split())
+    
+    def _thumbnail_cache_key(self, theme):
+        """Hash a normalized thumbnail theme into a short cache key."""
+        return hashlib.blake2b(theme.encode()).hexdigest()[:16]
+    
+    def _load_thumbnail_index(self):
+        """Load the theme-embedding index of cached thumbnails."""
+        index_path = self.thumbnail_cache_dir / 'index.json'
+        try:
+            return json.loads(index_path.read_text())
+        except (OSError, ValueError):
+            return {}
+    
+    def _save_thumbnail_index(self, index):
+        """Atomically write the theme-embedding index of cached thumbnails."""
+        index_path = self.thumbnail_cache_dir / 'index.json'
+        tmp_path = index_path.with_suffix('.tmp')
+        tmp_path.write_text(json.dumps(index))
+        os.replace(tmp_path, index_path)
     
-    def generate_thumbnail(self, title, filename):
+    def _find_similar_thumbnail(self, embedding, index):
+        """Return the cached thumbnail whose theme is closest to the embedding, if close enough."""
+        best_key, best_score = None, 0.0
+        for key, vector in index.items():
+            score = _cosine_similarity(embedding, vector)
+            if score > best_score:
+                best_key, best_score = key, score
+        
+        if best_key and best_score >= THUMBNAIL_SIMILARITY_THRESHOLD:
+            cached_path = self.thumbnail_cache_dir / f'{best_key}.png'
+            if cached_path.exists():
+                return cached_path
+        return None
+    
+    def _evict_thumbnail_cache(self, index):
+        """Drop the least recently used thumbnails beyond the cache size limit."""
+        cached = sorted(self.thumbnail_cache_dir.glob('*.png'), key=lambda p: p.stat().st_mtime)
+        for path in cached[:max(0, len(cached) - THUMBNAIL_CACHE_MAX_ENTRIES)]:
+            path.unlink(missing_ok=True)
+        
+        for key in list(index):
+            if not (self.thumbnail_cache_dir / f'{key}.png').exists():
+                del index[key]
+    
+    def _download_file(self, url, path):
+        """
+        Stream a URL to disk over the shared HTTP client.
+        
+        Connection errors and 5xx responses are retried with exponential backoff.
+        """
+        import httpx
+        
+        if self._http is None:
+            # Keep-alive HTTP client for downloading generated assets
+            self._http = httpx.Client(
+                http2=True,
+                timeout=30.0,
+                limits=httpx.Limits(max_connections=10, max_keepalive_connections=10)
+            )
+        
+        for attempt in range(DOWNLOAD_RETRIES + 1):
+            try:
+                with self._http.stream('GET', url) as response:
+                    response.raise_for_status()
+                    with open(path, 'wb') as f:
+                        for chunk in response.iter_bytes(64 * 1024):
+                            f.write(chunk)
+                return path
+            except (httpx.TransportError, httpx.HTTPStatusError) as e:
+                retriable = (
+                    isinstance(e, httpx.TransportError)
+                    or e.response.status_code >= 500
+                )
+                if not retriable or attempt == DOWNLOAD_RETRIES:
+                    raise
+                time.sleep(2 ** attempt)
+    
+    async def _embed_text(self, text):
+        """Embed text with the OpenAI embeddings endpoint."""
+        response = await self._call_openai(
+            self.client.embeddings.create,
+            model=THUMBNAIL_EMBEDDING_MODEL,
+            input=text,
+            dimensions=THUMBNAIL_EMBEDDING_DIMENSIONS
+        )
+        return response.data[0].embedding
+    
+    async def generate_thumbnail(self, title, filename):
         """
         Generate a thumbnail image using DALL-E.
         
+        Thumbnails are cached by title: an identical (normalized) title or
+        one whose embedding is close enough to a cached title reuses the
+        cached image instead of calling DALL-E again. Only the title is
+        compared, since the fixed prompt template would inflate similarity.
+        
         Args:
             title: Video title
             filename: Output filename
@@ -179,11 +637,32 @@ Format your response as JSON:
             Path: Path to thumbnail file
         """
         thumbnail_path = self.output_dir / 'thumbnails' / f'{filename}.png'
-        
-        print("Generating thumbnail with DALL-E...")
         prompt = f"Create a dark, eerie horror thumbnail for YouTube. Theme: {title}. Style: cinematic, dramatic lighting, red and black colors, mysterious atmosphere, high contrast"
         
-        response = self.client.images.generate(
+        # Look up an exact, then an approximate, cache hit
+        theme = self._normalize_theme(title)
+        key = self._thumbnail_cache_key(theme)
+        cached_path = self.thumbnail_cache_dir / f'{key}.png'
+        index = self._load_thumbnail_index()
+        embedding = index.get(key)
+        if not cached_path.exists():
+            try:
+                embedding = await self._embed_text(theme)
+            except Exception as e:
+                # The cache only saves cost; generate the thumbnail regardless
+                print(f"Warning: Thumbnail cache lookup failed: {e}")
+            else:
+                cached_path = self._find_similar_thumbnail(embedding, index) or cached_path
+        
+        if cached_path.exists():
+            shutil.copyfile(cached_path, thumbnail_path)
+            os.utime(cached_path)  # Mark as recently used
+            print(f"✓ Thumbnail reused from cache: {thumbnail_path}")
+            return thumbnail_path
+        
+        print("Generating thumbnail with DALL-E...")
+        response = await self._call_openai(
+            self.client.images.generate,
             model="dall-e-3",
             prompt=prompt,
             size="1792x1024",  # YouTube thumbnail aspect ratio
@@ -191,15 +670,91 @@ Format your response as JSON:
             n=1
         )
         
-        # Download and save thumbnail
-        import urllib.request
-        urllib.request.urlretrieve(response.data[0].url, str(thumbnail_path))
+        # Download into the cache and save thumbnail
+        partial_path = _partial_path(cached_path)
+        try:
+            await asyncio.to_thread(self._download_file, response.data[0].url, partial_path)
+            os.replace(partial_path, cached_path)
+        finally:
+            partial_path.unlink(missing_ok=True)
+        shutil.copyfile(cached_path, thumbnail_path)
+        
+        # Reload the index: concurrent cycles may have added entries meanwhile
+        index = self._load_thumbnail_index()
+        if embedding is not None:
+            index[key] = embedding
+        self._evict_thumbnail_cache(index)
+        self._save_thumbnail_index(index)
         print(f"✓ Thumbnail saved: {thumbnail_path}")
         return thumbnail_path
     
-    def create_complete_video(self, video_type='main', duration_minutes=3):
+    def _content_cache_paths(self, narration, video_type):
+        """Return the cached (audio, video) paths for a narration and video type."""
+        key = hashlib.blake2b(f'{video_type}\0{narration}'.encode()).hexdigest()[:32]
+        return self.content_cache_dir / f'{key}.mp3', self.content_cache_dir / f'{key}.mp4'
+    
+    def _evict_content_cache(self):
         """
-        Generate complete video: script → audio → video → thumbnail.
+        Drop the least recently used renders until the cache fits its size limit.
+        
+        Cache files are independent copies, so the bytes counted here are the
+        bytes freed by deleting them. Audio left without its video (an
+        interrupted cache write) is removed too.
+        """
+        entries = []
+        for video in self.content_cache_dir.glob('*.mp4'):
+            if '.part' in video.suffixes:
+                continue  # Being written by another cycle
+            audio = video.with_suffix('.mp3')
+            size = video.stat().st_size + (audio.stat().st_size if audio.exists() else 0)
+            entries.append((video.stat().st_mtime, size, video))
+        entries.sort()
+        
+        for audio in self.content_cache_dir.glob('*.mp3'):
+            if '.part' not in audio.suffixes and not audio.with_suffix('.mp4').exists():
+                audio.unlink(missing_ok=True)
+        
+        total = sum(size for _, size, _ in entries)
+        for _, size, video in entries:
+            if total <= CONTENT_CACHE_MAX_BYTES:
+                break
+            video.unlink(missing_ok=True)
+            video.with_suffix('.mp3').unlink(missing_ok=True)
+            total -= size
+    
+    async def _narrate_and_render(self, outline, video_type, duration_minutes, filename):
+        """
+        Write the narration for an outline, then stream it into the video.
+        
+        Renders are cached by narration and video type, so an identical
+        narration reuses the cached audio and video instead of running TTS
+        and FFmpeg again.
+        """
+        narration = await self.expand_narration(outline, video_type, duration_minutes)
+        
+        cached_audio, cached_video = self._content_cache_paths(narration, video_type)
+        if cached_audio.exists() and cached_video.exists():
+            audio_path = self.output_dir / 'audio' / f'{filename}.mp3'
+            video_path = self.output_dir / 'videos' / f'{filename}.mp4'
+            await asyncio.to_thread(shutil.copyfile, cached_audio, audio_path)
+            await asyncio.to_thread(shutil.copyfile, cached_video, video_path)
+            os.utime(cached_video)  # Mark as recently used
+            print(f"✓ Reused cached render for identical narration: {video_path}")
+            return audio_path, video_path
+        
+        audio_path, video_path = await self._stream_narration_video(narration, video_type, filename)
+        
+        await asyncio.to_thread(_copy_atomic, audio_path, cached_audio)
+        await asyncio.to_thread(_copy_atomic, video_path, cached_video)
+        self._evict_content_cache()
+        return audio_path, video_path
+    
+    async def create_complete_video(self, video_type='main', duration_minutes=3):
+        """
+        Generate complete video: outline → (narration → audio/video) + thumbnail.
+        
+        The thumbnail only needs the title, so it is generated while the
+        narration is written and streamed through TTS into FFmpeg.
         
         Args:
             video_type: 'main' or 'short'
@@ -209,39 +764,64 @@ Format your response as JSON:
             dict: Complete video data with paths and metadata
         """
         timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-        base_filename = f'{video_type}_{timestamp}'
-        
-        # Step 1: Generate script
-        script = self.generate_horror_script(video_type, duration_minutes)
+        # Concurrent cycles can start within the same second
+        base_filename = f'{video_type}_{timestamp}_{uuid.uuid4().hex[:8]}'
         
-        # Step 2: Generate audio
-        audio_path = self.generate_audio(script['narration'], base_filename)
+        # Step 1: Generate title and outline
+        outline = await self.generate_title_and_outline(video_type, duration_minutes)
         
-        # Step 3: Create video
-        video_path = self.create_video_with_ffmpeg(audio_path, video_type, base_filename)
-        
-        # Step 4: Generate thumbnail
-        thumbnail_path = self.generate_thumbnail(script['title'], base_filename)
+        # Step 2: Narration → audio + video, and thumbnail, in parallel
+        # (a failure in either cancels the other)
+        async with asyncio.TaskGroup() as tg:
+            render_task = tg.create_task(
+                self._narrate_and_render(outline, video_type, duration_minutes, base_filename)
+            )
+            thumbnail_task = tg.create_task(self.generate_thumbnail(outline['title'], base_filename))
+        audio_path, video_path = render_task.result()
+        thumbnail_path = thumbnail_task.result()
         
         return {
             'video_path': str(video_path),
             'thumbnail_path': str(thumbnail_path),
             'audio_path': str(audio_path),
-            'title': script['title'],
-            'description': script['description'],
-            'tags': script['tags'],
+            'title': outline['title'],
+            'description': outline['description'],
+            'tags': outline['tags'],
             'video_type': video_type,
             'timestamp': timestamp
         }
+    
+    def create_complete_video_sync(self, video_type='main', duration_minutes=3):
+        """Blocking wrapper around create_complete_video for synchronous callers."""
+        return asyncio.run(self.create_complete_video(video_type, duration_minutes))
+
+
+# Reused across cycles so the OpenAI client and detected encoder persist
+_pipeline = None
+_pipeline_lock = threading.Lock()
+
+
+def get_pipeline():
+    """
+    Return the shared VideoPipeline, creating it on first use.
+    
+    Creation probes FFmpeg encoders and blocks, so async callers should
+    call this from a worker thread.
+    """
+    global _pipeline
+    with _pipeline_lock:
+        if _pipeline is None:
+            _pipeline = VideoPipeline()
+        return _pipeline
 
 
 # Test function
 if __name__ == '__main__':
-    pipeline = VideoPipeline()
+    pipeline = get_pipeline()
     
     # Test script generation
     print("\n=== Testing Script Generation ===")
-    script = pipeline.generate_horror_script('main', 2)
+    script = asyncio.run(pipeline.generate_horror_script('main', 2))
     print(f"Title: {script['title']}")
     print(f"Tags: {', '.join(script['tags'])}")
     print(f"Narration length: {len(script['narration'])} characters")
@@ -1,10 +1,87 @@
+import io
 import os
 import pickle
 import json
-from google.oauth2.credentials import Credentials
-from googleapiclient.discovery import build
-from googleapiclient.http import MediaFileUpload
-from google.auth.transport.requests import Request
+import random
+import socket
+import threading
+import time
+from datetime import datetime, timedelta
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
+
+# Google API client libraries are imported inside the methods that use them
+# so importing this module (e.g. from scheduler.py) stays cheap.
+
+# Resumable upload tuning
+UPLOAD_CHUNK_SIZE = 16 * 1024 * 1024  # 16 MiB, must be a multiple of 256 KiB
+SOCKET_SEND_BUFFER_BYTES = 4 * 1024 * 1024
+HTTP_TIMEOUT_SECONDS = 300
+MAX_UPLOAD_RETRIES = 10
+RETRIABLE_STATUS_CODES = (429, 500, 502, 503, 504)
+
+# The YouTube Data API daily quota resets at midnight Pacific Time
+QUOTA_RESET_TIMEZONE = 'America/Los_Angeles'
+
+_large_buffer_http_class = None
+
+
+class QuotaExceededError(Exception):
+    """Raised when the daily YouTube Data API quota is exhausted."""
+    
+    def __init__(self, retry_after):
+        super().__init__(f"YouTube quota exceeded, resets in {retry_after / 3600:.1f} hours")
+        self.retry_after = retry_after
+
+
+def _seconds_until_quota_reset():
+    """Seconds until the next daily YouTube quota reset."""
+    try:
+        tz = ZoneInfo(QUOTA_RESET_TIMEZONE)
+    except ZoneInfoNotFoundError:
+        tz = ZoneInfo('UTC')
+    now = datetime.now(tz)
+    next_reset = datetime.combine(now.date() + timedelta(days=1), datetime.min.time(), tzinfo=tz)
+    return (next_reset - now).total_seconds()
+
+
+def _is_quota_exceeded(error):
+    """True if a googleapiclient HttpError is a 403 quotaExceeded response."""
+    content = error.content
+    if isinstance(content, bytes):
+        content = content.decode(errors='replace')
+    return error.resp.status == 403 and 'quotaExceeded' in str(content)
+
+
+def _get_large_buffer_http_class():
+    """
+    Return an httplib2.Http subclass whose HTTPS sockets use a large send buffer.
+    
+    A bigger SO_SNDBUF lets each upload chunk be handed to the kernel in
+    fewer, larger writes. Setting it disables the kernel's send-buffer
+    autotuning for the socket, and Linux caps it at net.core.wmem_max, so
+    it is only raised when the current buffer is smaller. The class is
+    built on first use so httplib2 is only imported when it is needed.
+    """
+    global _large_buffer_http_class
+    if _large_buffer_http_class is None:
+        import httplib2
+        
+        class LargeBufferHTTPSConnection(httplib2.HTTPSConnectionWithTimeout):
+            def connect(self):
+                super().connect()
+                current = self.sock.getsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF)
+                if current < SOCKET_SEND_BUFFER_BYTES:
+                    self.sock.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, SOCKET_SEND_BUFFER_BYTES)
+        
+        class LargeBufferHttp(httplib2.Http):
+            def request(self, uri, method='GET', body=None, headers=None,
+                        redirections=httplib2.DEFAULT_MAX_REDIRECTS, connection_type=None):
+                if connection_type is None and uri.startswith('https://'):
+                    connection_type = LargeBufferHTTPSConnection
+                return super().request(uri, method, body, headers, redirections, connection_type)
+        
+        _large_buffer_http_class = LargeBufferHttp
+    return _large_buffer_http_class
 
 
 class YouTubeUploader:
@@ -12,11 +89,52 @@ class YouTubeUploader:
     
     def __init__(self):
         """Initialize YouTube API client with credentials from env vars."""
+        from googleapiclient.discovery import build
+        
         self.credentials = self._load_credentials()
-        self.youtube = build('youtube', 'v3', credentials=self.credentials)
+        self._local = threading.local()
+        # Use the discovery document bundled with googleapiclient (no HTTP fetch)
+        self.youtube = build(
+            'youtube', 'v3',
+            http=self._thread_http(),
+            requestBuilder=self._build_request,
+            static_discovery=True
+        )
+    
+    def _thread_http(self):
+        """
+        Return this thread's authorized HTTP client.
+        
+        httplib2.Http is not thread-safe, so each worker thread keeps its own
+        keep-alive connection instead of sharing one across threads.
+        """
+        from google_auth_httplib2 import AuthorizedHttp
+        
+        http = getattr(self._local, 'http', None)
+        if http is None:
+            http_class = _get_large_buffer_http_class()
+            http = AuthorizedHttp(self.credentials, http=http_class(timeout=HTTP_TIMEOUT_SECONDS))
+            self._local.http = http
+        return http
+    
+    def _build_request(self, http, *args, **kwargs):
+        """Request builder that binds API requests to the calling thread's HTTP client."""
+        from googleapiclient.http import HttpRequest
+        
+        return HttpRequest(self._thread_http(), *args, **kwargs)
+    
+    def refresh_credentials(self):
+        """Refresh the OAuth access token if it has expired."""
+        from google.auth.transport.requests import Request
+        
+        if self.credentials.expired:
+            self.credentials.refresh(Request())
     
     def _load_credentials(self):
         """Build OAuth2 credentials from environment variables."""
+        from google.auth.transport.requests import Request
+        from google.oauth2.credentials import Credentials
+        
         client_id = os.getenv('YOUTUBE_CLIENT_ID')
         client_secret = os.getenv('YOUTUBE_CLIENT_SECRET')
         refresh_token = os.getenv('YOUTUBE_REFRESH_TOKEN')
@@ -58,7 +176,12 @@ class YouTubeUploader:
         
         Returns:
             dict: Upload response with video ID and URL
+        
+        Raises:
+            QuotaExceededError: The daily upload quota is exhausted
         """
+        from googleapiclient.http import MediaIoBaseUpload
+        
         if not os.path.exists(video_path):
             raise FileNotFoundError(f"Video file not found: {video_path}")
         
@@ -76,23 +199,23 @@ class YouTubeUploader:
             }
         }
         
-        # Create media upload
-        media = MediaFileUpload(
-            video_path,
-            chunksize=-1,  # Upload in a single request
-            resumable=True,
-            mimetype='video/*'
-        )
-        
-        # Execute upload
+        # Execute chunked resumable upload
         print(f"Uploading video: {title}")
-        request = self.youtube.videos().insert(
-            part='snippet,status',
-            body=body,
-            media_body=media
-        )
+        # Unbuffered raw file: each chunk is a single read() straight from the fd
+        with io.FileIO(os.open(video_path, os.O_RDONLY), closefd=True) as fh:
+            media = MediaIoBaseUpload(
+                fh,
+                mimetype='video/mp4',
+                chunksize=UPLOAD_CHUNK_SIZE,
+                resumable=True
+            )
+            request = self.youtube.videos().insert(
+                part='snippet,status',
+                body=body,
+                media_body=media
+            )
+            response = self._resumable_upload(request)
         
-        response = request.execute()
         video_id = response['id']
         video_url = f"https://www.youtube.com/watch?v={video_id}"
         
@@ -110,8 +233,58 @@ class YouTubeUploader:
             'status': 'success'
         }
     
+    def _resumable_upload(self, request):
+        """
+        Drive a resumable upload chunk by chunk.
+        
+        Failed chunks are retried in place with exponential backoff on
+        rate limiting (429), server errors (5xx) and connection errors.
+        An exhausted daily quota (403 quotaExceeded) is not retried here;
+        it raises QuotaExceededError so the caller can wait for the reset.
+        
+        Args:
+            request: googleapiclient HttpRequest with a resumable media body
+        
+        Returns:
+            dict: Final API response
+        """
+        import httplib2
+        from googleapiclient.errors import HttpError
+        
+        retriable_exceptions = (httplib2.HttpLib2Error, IOError)
+        response = None
+        retry = 0
+        while response is None:
+            error = None
+            try:
+                status, response = request.next_chunk(num_retries=5)
+                if status:
+                    print(f"Upload progress: {int(status.progress() * 100)}%")
+            except HttpError as e:
+                if _is_quota_exceeded(e):
+                    raise QuotaExceededError(_seconds_until_quota_reset()) from e
+                if e.resp.status not in RETRIABLE_STATUS_CODES:
+                    raise
+                error = f"Retriable HTTP error {e.resp.status}: {e}"
+            except retriable_exceptions as e:
+                error = f"Retriable error: {e}"
+            
+            if error is not None:
+                retry += 1
+                if retry > MAX_UPLOAD_RETRIES:
+                    raise RuntimeError(f"Upload failed after {MAX_UPLOAD_RETRIES} retries: {error}")
+                sleep_seconds = random.random() * (2 ** retry)
+                print(f"{error} - retrying in {sleep_seconds:.1f} seconds")
+                time.sleep(sleep_seconds)
+            else:
+                retry = 0
+        
+        return response
+    
     def _upload_thumbnail(self, video_id, thumbnail_path):
         """Upload a custom thumbnail for a video."""
+        from googleapiclient.http import MediaFileUpload
+        
         try:
             print(f"Uploading thumbnail for video {video_id}")
             self.youtube.thumbnails().set(